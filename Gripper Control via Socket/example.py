@@ -1,6 +1,6 @@
 import socket
 import time
-from gripper_methods import open_and_wait, close_and_wait
+from gripper_methods import OPEN_AND_WAIT, CLOSE_AND_WAIT, send_batch
 
 # CONSTANTS INIT
 
@@ -10,11 +10,11 @@ PORT = 30002
 # INIT SOCKET
 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 s.connect((HOST, PORT))
+s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
 # RUN PROGRAM
 
 time.sleep(1)
-open_and_wait(s=s)
-close_and_wait(s=s)
+send_batch(s=s, commands=[OPEN_AND_WAIT, CLOSE_AND_WAIT])
 time.sleep(1)
 s.close()
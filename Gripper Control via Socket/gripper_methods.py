@@ -1,18 +1,36 @@
 import socket
+from functools import lru_cache
 from gripper_methods_def import create_command
 
+OPEN_AND_WAIT = '$ 3 "rq_open_and_wait()"\n   rq_open_and_wait()'
+CLOSE_AND_WAIT = '$ 3 "rq_close_and_wait()"\n   rq_close_and_wait()'
+
+
+@lru_cache(maxsize=32)
+def _encode_command(command: str) -> bytes:
+    """
+    Builds and encodes the script for a command once, later calls reuse it.
+    """
+    return create_command(command).encode("utf8")
+
 
 def open_and_wait(s: socket.socket):
     """
     Open gripper.
     """
-    s.send(create_command(
-        '$ 3 "rq_open_and_wait()"\n   rq_open_and_wait()').encode("utf8"))
+    s.sendall(_encode_command(OPEN_AND_WAIT))
 
 
 def close_and_wait(s: socket.socket):
     """
     Close gripper.
     """
-    s.send(create_command(
-        '$ 3 "rq_close_and_wait()"\n   rq_close_and_wait()').encode("utf8"))
+    s.sendall(_encode_command(CLOSE_AND_WAIT))
+
+
+def send_batch(s: socket.socket, commands: list[str]):
+    """
+    Send several gripper commands (e.g. OPEN_AND_WAIT, CLOSE_AND_WAIT)
+    as one program in a single send, so they run back to back.
+    """
+    s.sendall(_encode_command("\n".join(commands)))
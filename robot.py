@@ -43,6 +43,8 @@ class Robot:
 
         # Placeholder for actual robot connection object (e.g., from rtde_control)
         self._connection = None
+        # Receive interface opened once in connect() and reused by the getters
+        self._connection_read = None
         print(f"Robot object created for IP: {self.ip}")
         print(f"Default home point set to: {self._home_point}")
         print(f"Initial offset: {self._offset}")
@@ -124,16 +126,22 @@ class Robot:
         # Example with rtde_control (requires installation: pip install rtde_control)
         try:
             import rtde_control
+            import rtde_receive
             self._connection = rtde_control.RTDEControlInterface(self.ip)
+            self._connection_read = rtde_receive.RTDEReceiveInterface(self.ip)
             print(f"Successfully connected to robot at {self.ip}.")
             return True
         except ImportError:
-            print("Warning: 'rtde_control' library not found. Cannot connect.")
+            print("Warning: 'rtde_control'/'rtde_receive' library not found. Cannot connect.")
             self._connection = None
+            self._connection_read = None
             return False
         except Exception as e:
             print(f"Error connecting to robot at {self.ip}: {e}")
+            if hasattr(self._connection, 'disconnect'):
+                self._connection.disconnect()
             self._connection = None
+            self._connection_read = None
             return False
         # self._connection = "Simulated Connection" # Placeholder
         # print("Connection successful (simulated).")
@@ -147,7 +155,10 @@ class Robot:
         # Example with rtde_control
         if hasattr(self._connection, 'disconnect'): # Check if it's an rtde obj
             self._connection.disconnect()
+        if hasattr(self._connection_read, 'disconnect'):
+            self._connection_read.disconnect()
         self._connection = None
+        self._connection_read = None
         # print("Disconnected (simulated).")
 
     def move_j(self, target_joints: list[float], speed: float = 0.5, acceleration: float = 1.0):
@@ -237,17 +248,13 @@ class Robot:
         Placeholder method to get the current joint angles.
         Returns a list of 6 joint angles or None if not connected/error.
         """
-        if not self._connection:
+        if self._connection_read is None:
             print("Error: Robot not connected.")
             return None
         print("Simulating getting current joint angles...")
-        # Real implementation example (rtde_receive):
+        # Reuse the receive interface opened in connect()
         try:
-            import rtde_receive
-            rtde_r = rtde_receive.RTDEReceiveInterface(self.ip)
-            actual_q = rtde_r.getActualQ()
-            rtde_r.disconnect()
-            return actual_q
+            return self._connection_read.getActualQ()
         except Exception as e:
             print(f"Error getting joint angles: {e}")
             return None
@@ -258,17 +265,13 @@ class Robot:
         Placeholder method to get the current TCP pose.
         Returns a list [x, y, z, rx, ry, rz] or None if not connected/error.
         """
-        if not self._connection:
+        if self._connection_read is None:
             print("Error: Robot not connected.")
             return None
         print("Simulating getting current TCP pose...")
-        # Real implementation example (rtde_receive):
+        # Reuse the receive interface opened in connect()
         try:
-            import rtde_receive
-            rtde_r = rtde_receive.RTDEReceiveInterface(self.ip)
-            actual_tcp = rtde_r.getActualTCPPose()
-            rtde_r.disconnect()
-            return actual_tcp
+            return self._connection_read.getActualTCPPose()
         except Exception as e:
             print(f"Error getting TCP pose: {e}")
             return None